@@ -1,126 +1,214 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless backend, safe to use from worker processes
 import matplotlib.pyplot as plt
 import numpy as np
 import os
 import sys
 import textwrap
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-def read_survey_data(file_path):
-    """Read survey data from a CSV file."""
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, without it the vote allocation kernel runs as plain NumPy code
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+# Characters replaced (or removed) when turning a question into a file name
+_FILENAME_TRANS = str.maketrans({':': '_', '?': '', ' ': '_'})
+
+# Specific colors for Yes, No, and Abstain, keyed by the lowercase answer
+_ANSWER_COLORS = {
+    'yes': '#2ecc71',      # Green
+    'no': '#e74c3c',       # Red
+    'abstain': '#95a5a6'   # Gray
+}
+
+def _first_rows(column):
+    """Return the row at which each answer in a survey column first appears, indexed by answer."""
+    first = column.dropna().drop_duplicates()
+    return pd.Series(first.index, index=first.astype(object), dtype=np.float64)
+
+def read_survey_data(file_path, chunksize=100_000):
+    """
+    Read survey data from a CSV file in chunks and count the answers to each question.
+    Only the counts are kept, so the full survey never has to be held in memory.
+    The answer columns (all but the first 3 metadata columns) are read as categoricals,
+    which store each distinct answer once and make counting them cheap.
+    Returns a DataFrame with the count of each answer (rows) per question (columns),
+    NaN where an answer was not given to a question, a DataFrame of the same shape with
+    the row at which each answer first appears for each question, and the total number of rows.
+    """
     try:
-        df = pd.read_csv(file_path)
-        return df
+        # Read only the header first to find the answer columns
+        header = pd.read_csv(file_path, nrows=0)
+        questions = header.columns[3:]
+        dtype = {column: 'category' for column in questions}
+        
+        counts_df = pd.DataFrame(columns=questions, dtype=np.float64)
+        first_rows_df = pd.DataFrame(columns=questions, dtype=np.float64)
+        total_rows = 0
+        with pd.read_csv(file_path, dtype=dtype, chunksize=chunksize) as reader:
+            for chunk in reader:
+                if chunk.empty:
+                    continue
+                
+                # Count occurrences of each response for every question in the chunk
+                # (NaN values represent 'No Selection' and are dropped)
+                chunk_counts = chunk[questions].apply(lambda column: column.value_counts(dropna=True))
+                counts_df = counts_df.add(chunk_counts, fill_value=0)
+                
+                # Remember where each answer first appears, earlier chunks take precedence
+                # (the counts are sorted by answer, this keeps ties between answers in survey order)
+                chunk_first_rows = chunk[questions].apply(_first_rows)
+                first_rows_df = first_rows_df.combine_first(chunk_first_rows)
+                total_rows += len(chunk)
+        
+        return counts_df, first_rows_df.reindex(counts_df.index), total_rows
     except Exception as e:
         print(f"Error reading the CSV file: {e}")
         sys.exit(1)
 
-def analyze_question(df, question_column):
+def analyze_questions(counts_df, total_rows):
     """
-    Analyze a specific question from the survey data.
-    Returns the count and percentage for each answer, excluding 'No Selection'.
-    Also returns the count of 'No Selection' responses.
+    Analyze all questions from the answer counts returned by read_survey_data().
+    Returns a matrix with the percentage of each answer (rows) per question (columns), excluding 'No Selection',
+    the total valid responses per question and the 'No Selection' count per question.
+    Answers not given to a question have a percentage of 0 (NaN for questions without valid responses).
     """
-    # Count total number of rows (all responses, including NaN)
-    total_rows = len(df)
+    counts_mat = counts_df.fillna(0).to_numpy(dtype=np.float64)
     
-    # Get all responses for this question (excluding NaN which represent 'No Selection')
-    responses = df[question_column].dropna()
+    # Calculate total valid responses per question
+    totals = counts_mat.sum(axis=0)
     
-    # Calculate 'No Selection' count
-    no_selection_count = total_rows - len(responses)
+    # Calculate 'No Selection' count per question from the total number of rows
+    no_selection_counts = total_rows - totals.astype(int)
     
-    # Count occurrences of each response
-    response_counts = Counter(responses)
+    # Calculate percentages with a single broadcasted divide
+    # (divide before scaling, multiplying by a reciprocal can break exact ties between answers)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct_mat = counts_mat / totals * 100
+    
+    return pct_mat, totals.astype(int), no_selection_counts
+
+def question_percentages(answers, pct_mat, first_rows, q):
+    """
+    Return the percentages of the answers given to question q (a column of the results of
+    analyze_questions()) as a dictionary, with the answers in the order they first appear in the survey.
+    The largest remainder method breaks ties in this order.
+    """
+    given = np.flatnonzero(pct_mat[:, q] > 0)
+    given = given[np.argsort(first_rows[given, q], kind='stable')]
+    return dict(zip(answers[given].tolist(), pct_mat[given, q].tolist()))
+
+@njit(cache=True)
+def _largest_remainder(pcts, seats):
+    """
+    Numeric kernel of the largest remainder method, compiled with numba when it is installed.
+    Returns the quotas, whole votes, remainders, answer indices ranked by remainder,
+    final votes and answer indices ranked by percentage.
+    """
+    # Step 1: Calculate initial quotas (votes proportionally out of the seats)
+    quotas = (pcts / 100) * seats
     
-    # Calculate total valid responses (excluding None/NaN which represent 'No Selection')
-    total_valid_responses = len(responses)
+    # Step 2: Allocate whole votes, keeping the remainder for potential additional votes
+    whole_votes = quotas.astype(np.int64)
+    remainders = quotas - whole_votes
     
-    if total_valid_responses == 0:
-        return {}, {}, 0, no_selection_count
+    # Step 3: Rank answers by remainder in descending order (stable, so ties keep answer order)
+    remainder_order = np.argsort(-remainders, kind='mergesort')
     
-    # Calculate percentages
-    response_percentages = {answer: (count / total_valid_responses) * 100 
-                           for answer, count in response_counts.items()}
+    # Step 4: Allocate remaining votes to the largest remainders
+    final_votes = whole_votes.copy()
+    for i in remainder_order[:seats - whole_votes.sum()]:
+        final_votes[i] += 1
     
-    return response_counts, response_percentages, total_valid_responses, no_selection_count
+    # Rank answers by percentage in descending order (stable, so ties keep answer order)
+    # A larger percentage never gets fewer votes, so this also ranks the final votes
+    percentage_order = np.argsort(-pcts, kind='mergesort')
+    
+    return quotas, whole_votes, remainders, remainder_order, final_votes, percentage_order
 
-def allocate_three_votes(percentages):
+def allocate_three_votes(percentages, build_steps=True):
     """
     Allocate 3 votes based on the percentages of each answer.
     Uses the largest remainder method.
-    Returns the vote allocation and step-by-step calculation details.
+    Returns the vote allocation, step-by-step calculation details
+    and the answers sorted by percentage (and so by votes) in descending order.
+    The calculation details are an empty string if build_steps is False.
     """
     if not percentages:
-        return {}, ""
-    
-    # For storing the step-by-step calculation for display
-    calculation_steps = []
-    
-    # Initial allocation based on percentages
-    votes_per_answer = {}
-    remaining = {}
-    
-    # Step 1: Calculate initial quotas
-    calculation_steps.append("Step 1: Calculate proportional votes (percentage × 3)")
-    for answer, pct in percentages.items():
-        # Calculate votes proportionally (out of 3)
-        votes = (pct / 100) * 3
-        # Format for display
-        calculation_steps.append(f"  {answer}: {pct:.1f}% × 3 = {votes:.2f}")
-    
-    # Step 2: Allocate whole votes
-    calculation_steps.append("\nStep 2: Allocate whole votes only")
-    for answer, pct in percentages.items():
-        votes = (pct / 100) * 3
-        # Whole votes
-        whole_votes = int(votes)
-        votes_per_answer[answer] = whole_votes
-        # Remainder for potential additional votes
-        remaining[answer] = votes - whole_votes
-        calculation_steps.append(f"  {answer}: {whole_votes} vote(s) (remainder: {remaining[answer]:.2f})")
-    
-    # Allocate remaining votes based on largest remainder
-    votes_allocated = sum(votes_per_answer.values())
-    votes_remaining = 3 - votes_allocated
-    
-    # Step 3: Sort by remainder
-    calculation_steps.append(f"\nStep 3: Allocate {votes_remaining} remaining vote(s) by largest remainder")
-    
-    # Sort answers by remainder in descending order
-    sorted_answers = sorted(remaining.items(), key=lambda x: x[1], reverse=True)
-    
-    # Show remainders in descending order
-    for i, (answer, remainder) in enumerate(sorted_answers):
-        if i < votes_remaining:
-            calculation_steps.append(f"  {answer}: +1 vote (remainder: {remainder:.2f})")
-        else:
-            calculation_steps.append(f"  {answer}: +0 votes (remainder: {remainder:.2f})")
-    
-    # Step 4: Allocate remaining votes
-    for i in range(votes_remaining):
-        if i < len(sorted_answers):
-            answer = sorted_answers[i][0]
-            votes_per_answer[answer] += 1
-    
-    # Step 5: Final allocation
-    calculation_steps.append("\nFinal 3-vote allocation:")
-    for answer, votes in sorted(votes_per_answer.items(), key=lambda x: x[1], reverse=True):
-        if votes > 0:
-            calculation_steps.append(f"  {answer}: {votes} vote(s)")
-    
-    # Join all steps into a single string
-    calculation_text = "\n".join(calculation_steps)
-    
-    return votes_per_answer, calculation_text
+        return {}, "", []
+    
+    answers = list(percentages.keys())
+    pcts = np.fromiter(percentages.values(), dtype=np.float64, count=len(answers))
+    
+    quotas, whole_votes, remainders, remainder_order, final_votes, percentage_order = _largest_remainder(pcts, 3)
+    votes_remaining = 3 - int(whole_votes.sum())
+    
+    votes_per_answer = dict(zip(answers, final_votes.tolist()))
+    answer_order = [answers[i] for i in percentage_order.tolist()]
+    
+    if not build_steps:
+        return votes_per_answer, "", answer_order
+    
+    # Build the step-by-step calculation for display in a single pass
+    quota_lines = [f"  {answer}: {pct:.1f}% × 3 = {votes:.2f}"
+                   for answer, pct, votes in zip(answers, pcts.tolist(), quotas.tolist())]
+    whole_lines = [f"  {answer}: {votes} vote(s) (remainder: {remainder:.2f})"
+                   for answer, votes, remainder in zip(answers, whole_votes.tolist(), remainders.tolist())]
+    remainder_lines = [f"  {answers[i]}: {'+1 vote' if rank < votes_remaining else '+0 votes'} (remainder: {remainders[i]:.2f})"
+                       for rank, i in enumerate(remainder_order.tolist())]
+    final_lines = [f"  {answer}: {votes_per_answer[answer]} vote(s)"
+                   for answer in answer_order if votes_per_answer[answer] > 0]
+    
+    calculation_text = "\n".join([
+        "Step 1: Calculate proportional votes (percentage × 3)",
+        *quota_lines,
+        "\nStep 2: Allocate whole votes only",
+        *whole_lines,
+        f"\nStep 3: Allocate {votes_remaining} remaining vote(s) by largest remainder",
+        *remainder_lines,
+        "\nFinal 3-vote allocation:",
+        *final_lines,
+    ])
+    
+    return votes_per_answer, calculation_text, answer_order
+
+def create_figure():
+    """
+    Create the figure and subplots used to visualize a question.
+    The figure is created once and reused for every question.
+    """
+    # Create a figure with a proper title area and space for calculation text
+    # The constrained layout is computed while drawing, so saving needs no separate tight bounding box pass
+    fig = plt.figure(figsize=(18, 12), layout='constrained')
+    
+    # Define a grid layout
+    gs = fig.add_gridspec(3, 3)
+    
+    # Create the pie chart subplots
+    ax1 = fig.add_subplot(gs[0:2, 0:2])  # Percentage pie chart (larger)
+    ax2 = fig.add_subplot(gs[0:2, 2])    # Vote allocation pie chart
+    
+    # Create a text box for the calculation steps
+    ax_text = fig.add_subplot(gs[2, :])
+    
+    return fig, ax1, ax2, ax_text
 
-def plot_question_results(question, percentages, vote_allocation, total_responses, no_selection_count, calculation_text, output_dir='plots'):
+def plot_question_results(fig, ax1, ax2, ax_text, question, percentages, vote_allocation, total_responses, no_selection_count, calculation_text, output_dir='plots', dpi=150, file_format='png', wrapped_question=None, question_clean=None):
     """
     Create visualizations for a question showing:
     1. A pie chart for percentages of each answer
     2. A pie chart for the 3-vote allocation
     3. Step-by-step calculation of the vote allocation
     With enhanced aesthetics and the question displayed on the figure.
+    The figure and subplots from create_figure() are cleared and redrawn for each question.
+    The plot is saved as file_format ('png' or 'svg'); dpi only affects raster formats.
+    Without calculation_text the calculation section is left out and the pie charts use the full height.
+    wrapped_question is the question already wrapped for the title; it is wrapped here if not given.
+    question_clean is the question already cleaned up for the file name; it is cleaned up here if not given.
     """
     if not percentages:
         return
@@ -128,43 +216,55 @@ def plot_question_results(question, percentages, vote_allocation, total_response
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Create a figure with a proper title area and space for calculation text
-    fig = plt.figure(figsize=(18, 12))
-    
-    # Define a grid layout
-    gs = fig.add_gridspec(3, 3)
+    # Clear the content left over from the previous question
+    for axis in [ax1, ax2, ax_text]:
+        axis.clear()
+    for legend in list(fig.legends):
+        legend.remove()
     
     # Add a title for the entire figure containing the question
     # Wrap the question text for better readability
-    wrapped_question = "\n".join(textwrap.wrap(question, width=80))
-    fig.suptitle(wrapped_question, fontsize=14, fontweight='bold', y=0.98)
+    if wrapped_question is None:
+        wrapped_question = "\n".join(textwrap.wrap(question, width=80))
+    fig.suptitle(wrapped_question, fontsize=14, fontweight='bold')
     
-    # Create the pie chart subplots
-    ax1 = fig.add_subplot(gs[0:2, 0:2])  # Percentage pie chart (larger)
-    ax2 = fig.add_subplot(gs[0:2, 2])    # Vote allocation pie chart
-    
-    # Create a text box for the calculation steps
-    ax_text = fig.add_subplot(gs[2, :])
     ax_text.axis('off')  # Hide axes
     
+    # Use the full height for the pie charts when there are no calculation steps to show
+    gs = ax1.get_subplotspec().get_gridspec()
+    if calculation_text:
+        # Make the calculation row tall enough for every line of the text box (12pt per line plus the box padding),
+        # at least the original third of the 18x12 inch figure
+        text_height = max(4, (12 * (calculation_text.count('\n') + 1) + 30) / 72)
+        fig.set_size_inches(18, 8 + text_height)
+        gs.set_height_ratios([4, 4, text_height])
+        ax1.set_subplotspec(gs[0:2, 0:2])
+        ax2.set_subplotspec(gs[0:2, 2])
+    else:
+        fig.set_size_inches(18, 12)
+        gs.set_height_ratios(None)
+        ax1.set_subplotspec(gs[:, 0:2])
+        ax2.set_subplotspec(gs[:, 2])
+    ax_text.set_visible(bool(calculation_text))
+    
+    # Start the constrained layout from the grid positions so the result does not depend on the previous question,
+    # setting a position takes the subplot out of the layout, so put it back in
+    for axis in [ax1, ax2, ax_text]:
+        axis.set_position(axis.get_subplotspec().get_position(fig))
+        axis.set_in_layout(True)
+    
     # Prepare the data for the first subplot (percentages)
-    answers = list(percentages.keys())
-    pcts = list(percentages.values())
+    answers = np.array(list(percentages.keys()), dtype=object)
+    pcts = np.fromiter(percentages.values(), dtype=np.float64, count=len(answers))
     
     # Sort by percentage in descending order for better labeling
-    sorted_indices = np.argsort(pcts)[::-1]
-    answers = [answers[i] for i in sorted_indices]
-    pcts = [pcts[i] for i in sorted_indices]
-    
-    # Assign specific colors for Yes, No, and Abstain, and generate colors for other answers
-    color_map = {
-        'Yes': '#2ecc71',  # Green
-        'yes': '#2ecc71',  # Green (lowercase)
-        'No': '#e74c3c',   # Red
-        'no': '#e74c3c',   # Red (lowercase)
-        'Abstain': '#95a5a6',  # Gray
-        'abstain': '#95a5a6'   # Gray (lowercase)
-    }
+    order = np.argsort(-pcts, kind='stable')
+    answers = answers[order]
+    pcts = pcts[order]
+    
+    # Precompute the palette for answers without a predefined color
+    # Use plasma colormap but avoid the greenish and reddish parts that might be confused with Yes/No
+    custom_colors = plt.cm.plasma(0.1 + 0.8 * np.arange(1, len(answers) + 1) / (len(answers) + 1))
     
     # Generate a list of colors for each answer
     colors = []
@@ -172,17 +272,12 @@ def plot_question_results(question, percentages, vote_allocation, total_response
     custom_color_count = 0
     
     for answer in answers:
-        if answer.lower() in [k.lower() for k in color_map.keys()]:
-            # Use the predefined color for Yes, No, or Abstain (case insensitive)
-            for k in color_map.keys():
-                if answer.lower() == k.lower():
-                    colors.append(color_map[k])
-                    break
-        else:
-            # Generate a color from viridis palette for other answers
+        # Use the predefined color for Yes, No, or Abstain (case insensitive)
+        color = _ANSWER_COLORS.get(answer.lower())
+        if color is None:
+            color = custom_colors[custom_color_count]
             custom_color_count += 1
-            # Use viridis colormap but avoid the greenish and reddish parts that might be confused with Yes/No
-            colors.append(plt.cm.plasma(0.1 + 0.8 * custom_color_count / (len(answers) + 1)))
+        colors.append(color)
     
     # Explode the largest slice slightly for emphasis
     explode = [0.05 if i == 0 else 0 for i in range(len(answers))]
@@ -196,7 +291,7 @@ def plot_question_results(question, percentages, vote_allocation, total_response
         startangle=90,
         explode=explode,
         shadow=False,  # Remove shadow effect
-        wedgeprops={'edgecolor': 'w', 'linewidth': 1, 'alpha': 0.9},
+        wedgeprops={'edgecolor': 'w', 'linewidth': 1, 'alpha': 0.9, 'width': 0.7},  # Donut with a clean center
         textprops={'fontsize': 11}
     )
     
@@ -216,25 +311,19 @@ def plot_question_results(question, percentages, vote_allocation, total_response
     ax1.set_title(f'Response Distribution\n(Total Valid Responses: {total_responses}, No Selection: {no_selection_count})', 
                  fontsize=12, pad=10)
     
-    # Create a clean circle in the middle for better aesthetics
-    circle = plt.Circle((0,0), 0.3, fc='white')
-    ax1.add_artist(circle)
-    
     # Prepare the data for the second subplot (3-vote allocation)
-    vote_answers = list(vote_allocation.keys())
-    vote_counts = list(vote_allocation.values())
+    vote_answers = np.array(list(vote_allocation.keys()), dtype=object)
+    vote_counts = np.fromiter(vote_allocation.values(), dtype=np.int64, count=len(vote_answers))
     
     # Filter to only include answers with votes
-    nonzero_indices = [i for i, count in enumerate(vote_counts) if count > 0]
-    vote_answers = [vote_answers[i] for i in nonzero_indices]
-    vote_counts = [vote_counts[i] for i in nonzero_indices]
+    has_votes = vote_counts > 0
+    vote_answers = vote_answers[has_votes]
+    vote_counts = vote_counts[has_votes]
     
-    if vote_counts:  # Only create the pie if there are votes
+    if vote_counts.size:  # Only create the pie if there are votes
         # Generate colors for the vote pie chart (match colors with first pie chart)
-        vote_colors = []
-        for ans in vote_answers:
-            idx = answers.index(ans)
-            vote_colors.append(colors[idx])
+        answer_colors = dict(zip(answers.tolist(), colors))
+        vote_colors = [answer_colors[ans] for ans in vote_answers]
         
         # Plot vote allocation as a pie chart (no shadow)
         vote_wedges, vote_texts, vote_autotexts = ax2.pie(
@@ -244,17 +333,13 @@ def plot_question_results(question, percentages, vote_allocation, total_response
             colors=vote_colors,
             startangle=90,
             shadow=False,  # Remove shadow effect
-            wedgeprops={'edgecolor': 'w', 'linewidth': 1, 'alpha': 0.9},
+            wedgeprops={'edgecolor': 'w', 'linewidth': 1, 'alpha': 0.9, 'width': 0.7},  # Donut with a clean center
             textprops={'fontsize': 11}
         )
         
         # Format the pie chart labels and counts
         plt.setp(vote_autotexts, size=13, weight="bold", color='white')
         plt.setp(vote_texts, size=11)
-        
-        # Create a clean circle in the middle for better aesthetics
-        vote_circle = plt.Circle((0,0), 0.3, fc='white')
-        ax2.add_artist(vote_circle)
     
     # Set title for the vote allocation
     ax2.set_title('3-Vote Allocation', fontsize=12, pad=10)
@@ -262,109 +347,133 @@ def plot_question_results(question, percentages, vote_allocation, total_response
     # Add a legend outside the plots for better readability
     if len(answers) > 3:
         handles = [plt.Rectangle((0,0),1,1, color=colors[i]) for i in range(len(answers))]
-        legend = fig.legend(handles, answers, 
-                           loc='upper center', 
-                           bbox_to_anchor=(0.5, 0.32),
+        legend = fig.legend(handles, answers.tolist(), 
+                           loc='outside lower center',  # The constrained layout makes room for it
                            ncol=min(5, len(answers)),
                            frameon=True,
                            facecolor='white',
                            edgecolor='lightgray',
                            fontsize=10)
     
-    # Add the calculation text to the text box
-    ax_text.text(0.01, 0.99, calculation_text, 
-                 transform=ax_text.transAxes,
-                 verticalalignment='top',
-                 horizontalalignment='left',
-                 fontfamily='monospace',
-                 fontsize=10,
-                 bbox=dict(boxstyle='round,pad=1', facecolor='#f8f9fa', edgecolor='#dcdcdc', alpha=0.9))
-    
-    # Add descriptive title for the calculation section
-    ax_text.text(0.5, 1.05, 'Step-by-Step Calculation of 3-Vote Allocation using Largest Remainder Method', 
-                 transform=ax_text.transAxes,
-                 verticalalignment='center',
-                 horizontalalignment='center',
-                 fontsize=12,
-                 fontweight='bold')
-    
-    # Adjust layout
-    plt.tight_layout(rect=[0, 0.02, 1, 0.96])  # Make room for the title
+    if calculation_text:
+        # Add the calculation text to the text box
+        ax_text.text(0.01, 0.99, calculation_text, 
+                     transform=ax_text.transAxes,
+                     verticalalignment='top',
+                     horizontalalignment='left',
+                     fontfamily='monospace',
+                     fontsize=10,
+                     bbox=dict(boxstyle='round,pad=1', facecolor='#f8f9fa', edgecolor='#dcdcdc', alpha=0.9))
+        
+        # Add descriptive title for the calculation section
+        ax_text.text(0.5, 1.05, 'Step-by-Step Calculation of 3-Vote Allocation using Largest Remainder Method', 
+                     transform=ax_text.transAxes,
+                     verticalalignment='center',
+                     horizontalalignment='center',
+                     fontsize=12,
+                     fontweight='bold')
     
     # Clean up question text for filename
-    question_clean = question.replace(':', '_').replace('?', '').replace(' ', '_')[:50]
-    file_path = os.path.join(output_dir, f'{question_clean}.png')
-    plt.savefig(file_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    if question_clean is None:
+        question_clean = question.translate(_FILENAME_TRANS)[:50]
+    file_path = os.path.join(output_dir, f'{question_clean}.{file_format}')
+    fig.savefig(file_path, dpi=dpi, format=file_format)
     
     return file_path
 
+# Figure reused by all plots made in a worker process, created by _init_plot_worker()
+_worker_figure = None
+
+def _init_plot_worker():
+    """Create the figure once per worker process."""
+    global _worker_figure
+    _worker_figure = create_figure()
+
+def _plot_question_in_worker(plot_kwargs):
+    """Plot a question on the worker's figure. plot_kwargs are the keyword arguments of plot_question_results after the figure and subplots."""
+    return plot_question_results(*_worker_figure, **plot_kwargs)
+
 def main():
     # Check for proper command-line arguments
-    if len(sys.argv) < 2 or len(sys.argv) > 3:
-        print("Usage: python analyze_survey.py <csv_file_path> [output_directory]")
+    build_steps = '--no-steps' not in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--no-steps']
+    if len(args) < 1 or len(args) > 2:
+        print("Usage: python analyze_survey.py [--no-steps] <csv_file_path> [output_directory]")
         sys.exit(1)
     
-    file_path = sys.argv[1]
+    file_path = args[0]
     
     # Set output directory (default or user-specified)
     output_dir = 'plots'
-    if len(sys.argv) == 3:
-        output_dir = sys.argv[2]
+    if len(args) == 2:
+        output_dir = args[1]
     
     print(f"Processing survey data from: {file_path}")
     print(f"Results will be saved to: {output_dir}")
     
-    # Read survey data
-    survey_data = read_survey_data(file_path)
+    # Read survey data and count the answers to each question (skipping the first 3 columns which are metadata)
+    counts_df, first_rows_df, total_rows = read_survey_data(file_path)
+    questions = counts_df.columns
     
-    # Process each question (skip the first 3 columns which are metadata)
-    questions = survey_data.columns[3:]
+    # Analyze all questions in one pass
+    pct_mat, totals, no_selection_counts = analyze_questions(counts_df, total_rows)
+    answers = counts_df.index.to_numpy(dtype=object)
+    first_rows = first_rows_df.to_numpy(dtype=np.float64)
     
     # Store results for summary
     results = []
     
-    for question in questions:
+    for q, question in enumerate(questions):
         print(f"\nAnalyzing question: {question}")
         
-        # Analyze the question
-        counts, percentages, total_responses, no_selection_count = analyze_question(survey_data, question)
+        # Collect the answers given for this question
+        percentages = question_percentages(answers, pct_mat, first_rows, q)
+        total_responses = int(totals[q])
+        no_selection_count = int(no_selection_counts[q])
         
         if not percentages:
             print(f"  No valid responses for this question.")
             continue
         
+        # Allocate 3 votes with calculation steps
+        vote_allocation, calculation_text, answer_order = allocate_three_votes(percentages, build_steps)
+        
         # Print percentages
         print(f"  Total valid responses: {total_responses}")
         print(f"  'No Selection' responses: {no_selection_count}")
         print("  Response percentages:")
-        for answer, pct in sorted(percentages.items(), key=lambda x: x[1], reverse=True):
-            print(f"    {answer}: {pct:.1f}%")
+        for answer in answer_order:
+            print(f"    {answer}: {percentages[answer]:.1f}%")
         
-        # Allocate 3 votes with calculation steps
-        vote_allocation, calculation_text = allocate_three_votes(percentages)
-        
-        # Print vote allocation
+        # Print vote allocation (answers sorted by percentage are also sorted by votes)
         print("  3-vote allocation:")
-        for answer, votes in sorted(vote_allocation.items(), key=lambda x: x[1], reverse=True):
-            if votes > 0:
-                print(f"    {answer}: {votes} vote(s)")
-        
-        # Plot the results with the specified output directory
-        plot_file = plot_question_results(question, percentages, vote_allocation, total_responses, 
-                                         no_selection_count, calculation_text, output_dir=output_dir)
+        for answer in answer_order:
+            if vote_allocation[answer] > 0:
+                print(f"    {answer}: {vote_allocation[answer]} vote(s)")
         
-        # Save results for summary
+        # Save results for summary, with the question already prepared for the plot title and file name
         results.append({
             'question': question,
+            'wrapped_question': "\n".join(textwrap.wrap(question, width=80)),
+            'question_clean': question.translate(_FILENAME_TRANS)[:50],
             'percentages': percentages,
             'vote_allocation': vote_allocation,
             'total_responses': total_responses,
             'no_selection_count': no_selection_count,
             'calculation_text': calculation_text,
-            'plot_file': plot_file
+            'plot_file': None
         })
     
+    # Plot the results in parallel, each question is independent of the others
+    if results:
+        plot_fields = ['question', 'wrapped_question', 'question_clean', 'percentages', 'vote_allocation', 'total_responses',
+                       'no_selection_count', 'calculation_text']
+        plot_jobs = [dict({field: result[field] for field in plot_fields}, output_dir=output_dir) for result in results]
+        max_workers = min(os.cpu_count() or 1, len(plot_jobs))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_plot_worker) as executor:
+            for result, plot_file in zip(results, executor.map(_plot_question_in_worker, plot_jobs)):
+                result['plot_file'] = plot_file
+    
     print(f"\nAnalysis complete. Plots saved in the '{output_dir}' directory.")
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analyze_survey import allocate_three_votes, analyze_questions, main, question_percentages, read_survey_data
+
+
+def write_survey(tmp_path, questions, rows):
+    """Write a survey CSV with the 3 metadata columns followed by the given questions."""
+    file_path = tmp_path / 'survey.csv'
+    lines = [','.join(['Submitter', 'Submitter Email', 'Submission Date'] + questions)]
+    lines += [',,2023-09-10,' + ','.join(row) for row in rows]
+    file_path.write_text('\n'.join(lines) + '\n')
+    return file_path
+
+
+def allocate_questions(file_path, chunksize=100_000):
+    """Run the analysis on a survey CSV and return the percentages and vote allocation per question."""
+    counts_df, first_rows_df, total_rows = read_survey_data(file_path, chunksize=chunksize)
+    pct_mat, totals, no_selection_counts = analyze_questions(counts_df, total_rows)
+    answers = counts_df.index.to_numpy(dtype=object)
+    first_rows = first_rows_df.to_numpy(dtype=float)
+    results = {}
+    for q, question in enumerate(counts_df.columns):
+        percentages = question_percentages(answers, pct_mat, first_rows, q)
+        results[question] = (percentages, allocate_three_votes(percentages)[0])
+    return results
+
+
+@pytest.mark.parametrize('chunksize', [100_000, 1])
+def test_tie_goes_to_answer_appearing_first(tmp_path, chunksize):
+    file_path = write_survey(tmp_path, ['Q'], [['Yes'], ['No'], ['No'], ['Yes']])
+    percentages, votes = allocate_questions(file_path, chunksize)['Q']
+    assert list(percentages) == ['Yes', 'No']
+    assert votes == {'Yes': 2, 'No': 1}
+
+
+@pytest.mark.parametrize('chunksize', [100_000, 2])
+def test_five_way_tie_keeps_survey_order(tmp_path, chunksize):
+    file_path = write_survey(tmp_path, ['Q'], [['Zeta'], ['Alpha'], ['Beta'], ['Gamma'], ['Delta']])
+    percentages, votes = allocate_questions(file_path, chunksize)['Q']
+    assert list(percentages) == ['Zeta', 'Alpha', 'Beta', 'Gamma', 'Delta']
+    assert votes == {'Zeta': 1, 'Alpha': 1, 'Beta': 1, 'Gamma': 0, 'Delta': 0}
+
+
+def test_answer_order_is_tracked_per_question(tmp_path):
+    file_path = write_survey(tmp_path, ['Q1', 'Q2'], [['Yes', 'No'], ['No', ''], ['', 'Yes'], ['', '']])
+    results = allocate_questions(file_path, chunksize=1)
+    assert results['Q1'][1] == {'Yes': 2, 'No': 1}
+    assert results['Q2'][1] == {'No': 2, 'Yes': 1}
+
+
+def test_no_steps_gives_same_votes_without_calculation_text():
+    percentages = {'Yes': 50.0, 'No': 50.0}
+    votes, calculation_text, answer_order = allocate_three_votes(percentages, build_steps=False)
+    assert calculation_text == ""
+    assert (votes, answer_order) == allocate_three_votes(percentages)[::2]
+
+
+def test_main_with_no_steps_flag(tmp_path, monkeypatch):
+    file_path = write_survey(tmp_path, ['Q'], [['Yes'], ['No'], ['Yes']])
+    output_dir = tmp_path / 'plots'
+    monkeypatch.setattr(sys, 'argv', ['analyze_survey.py', '--no-steps', str(file_path), str(output_dir)])
+    main()
+    assert os.listdir(output_dir) == ['Q.png']